@@ -329,6 +329,10 @@ if [ -n "$PIP_CMD" ]; then
     echo -e "${YELLOW}Installing ffmpeg-python...${NC}"
     $PIP_CMD install ffmpeg-python==0.2.0 --no-cache-dir || echo -e "${RED}Failed to install ffmpeg-python. Audio conversion may be limited.${NC}"
     
+    # Install PyAV (in-process audio decoding)
+    echo -e "${YELLOW}Installing av...${NC}"
+    $PIP_CMD install av --no-cache-dir || echo -e "${RED}Failed to install av. Audio will be decoded with the ffmpeg command.${NC}"
+    
     # Install pydub
     echo -e "${YELLOW}Installing pydub...${NC}"
     $PIP_CMD install pydub --no-cache-dir || echo -e "${RED}Failed to install pydub. Audio processing may be limited.${NC}"
@@ -340,14 +344,30 @@ if [ -n "$PIP_CMD" ]; then
         $PIP_CMD install torch --index-url https://download.pytorch.org/whl/cpu --no-cache-dir || echo -e "${RED}Failed to install torch. Whisper functionality may be limited.${NC}"
     }
     
+    # Install silero-vad (silence trimming for whisper, bundles its model)
+    echo -e "${YELLOW}Installing silero-vad...${NC}"
+    $PIP_CMD install silero-vad --no-cache-dir || echo -e "${RED}Failed to install silero-vad. Whisper will transcribe whole tracks without trimming silence.${NC}"
+    
     # Install numpy
     echo -e "${YELLOW}Installing numpy...${NC}"
     $PIP_CMD install numpy --no-cache-dir || echo -e "${RED}Failed to install numpy. Some features may be limited.${NC}"
     
+    # Install orjson (faster lyrics JSON encoding)
+    echo -e "${YELLOW}Installing orjson...${NC}"
+    $PIP_CMD install orjson --no-cache-dir || echo -e "${RED}Failed to install orjson. The standard json module will be used.${NC}"
+    
     # Install whisper
     echo -e "${YELLOW}Installing whisper...${NC}"
     $PIP_CMD install openai-whisper --no-cache-dir || echo -e "${RED}Failed to install whisper. Transcription functionality may be limited.${NC}"
     
+    # Install faster-whisper (CTranslate2 int8 backend)
+    echo -e "${YELLOW}Installing faster-whisper...${NC}"
+    $PIP_CMD install faster-whisper --no-cache-dir || echo -e "${RED}Failed to install faster-whisper. Transcription will use the slower whisper backend.${NC}"
+    
+    # Install sounddevice and soundfile (in-process low-latency playback)
+    echo -e "${YELLOW}Installing sounddevice...${NC}"
+    $PIP_CMD install sounddevice soundfile --no-cache-dir || echo -e "${RED}Failed to install sounddevice. Falling back to playsound.${NC}"
+    
     # Try different playsound versions
     echo -e "${YELLOW}Installing playsound...${NC}"
     $PIP_CMD install playsound==1.2.2 --no-cache-dir || {
@@ -1,22 +1,50 @@
 # Fallback playsound module
+import os
+import subprocess
+
+# ffplay process started by the most recent playsound() call
+_process = None
+
+
 def playsound(sound_file, block=True):
     """
     Fallback playsound function that uses ffplay from ffmpeg
+
+    Returns True if ffplay was started; use stop() to end playback early.
     """
-    import subprocess
-    import os
-    
+    global _process
+
     if not os.path.exists(sound_file):
         raise FileNotFoundError(f"Sound file not found: {sound_file}")
-    
+
+    # Only one sound plays at a time
+    stop()
+
     try:
-        # Use ffplay from ffmpeg to play the sound
-        cmd = ["ffplay", "-nodisp", "-autoexit", "-hide_banner", "-loglevel", "quiet", sound_file]
+        # Use ffplay from ffmpeg to play the sound, skipping input buffering
+        # so playback starts as soon as the process is up
+        cmd = [
+            "ffplay", "-nodisp", "-autoexit", "-hide_banner", "-loglevel", "quiet",
+            "-fflags", "nobuffer", "-flags", "low_delay",
+            "-sync", "audio",
+            sound_file
+        ]
+        _process = subprocess.Popen(cmd)
         if block:
-            subprocess.call(cmd)
-        else:
-            subprocess.Popen(cmd)
+            _process.wait()
         return True
     except Exception as e:
         print(f"Error playing sound: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def stop():
+    """
+    Stop the sound started by the last playsound call, if it is still playing
+    """
+    global _process
+
+    if _process is not None and _process.poll() is None:
+        _process.terminate()
+        _process.wait()
+    _process = None
@@ -11,34 +11,55 @@ import time
 import threading
 import subprocess
 import argparse
+import platform
+import re
+import array
+import wave
+import asyncio
+import bisect
+import shutil
+import hashlib
+import functools
+import importlib.util
+from concurrent.futures import Future
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 
 # Flag to track if modules are available
 WHISPER_AVAILABLE = False
+FASTER_WHISPER_AVAILABLE = False
+TRANSFORMERS_AVAILABLE = False
+TORCH_AVAILABLE = False
+SILERO_VAD_AVAILABLE = False
 FFMPEG_AVAILABLE = False
 RICH_AVAILABLE = False
 PLAYSOUND_AVAILABLE = False
+SOUNDDEVICE_AVAILABLE = False
 PYDUB_AVAILABLE = False
+NUMPY_AVAILABLE = False
+ORJSON_AVAILABLE = False
+AV_AVAILABLE = False
 
-# Try to import required packages with fallbacks
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
+# The Whisper backends (and torch behind openai-whisper) take seconds to import,
+# so they are only located here and imported when a transcription needs them
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+if not WHISPER_AVAILABLE:
     print("Whisper is not installed. Some features will be limited.")
-    # Create a mock whisper module for basic functionality
-    class MockWhisper:
-        @staticmethod
-        def load_model(name):
-            return MockWhisperModel()
-    
-    class MockWhisperModel:
-        def transcribe(self, audio_path, **kwargs):
-            print(f"[Mock] Would transcribe {audio_path}")
-            return {"segments": []}
-    
-    whisper = MockWhisper()
+
+# torch is only needed by the openai-whisper backend
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
+# The silero-vad package trims silence for openai-whisper without fetching code
+SILERO_VAD_AVAILABLE = importlib.util.find_spec("silero_vad") is not None
+
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+if not FASTER_WHISPER_AVAILABLE:
+    print("faster-whisper is not installed. Transcription will be slower.")
+
+# Hugging Face transformers runs distil-whisper, for --backend transformers
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+
+# Try to import required packages with fallbacks
 
 try:
     import ffmpeg
@@ -80,26 +101,31 @@ try:
     from rich.console import Console
     from rich.panel import Panel
     from rich.prompt import Prompt, Confirm
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
     from rich.table import Table
-    from rich.text import Text
+    from rich.text import Text, Span
+    from rich.style import Style
     from rich.layout import Layout
     from rich.live import Live
     from rich.align import Align
-    from rich.box import Box
     RICH_AVAILABLE = True
+    
+    # Styles of the lyrics display, parsed once
+    ART_STYLE = Style.parse("bold cyan")
+    WORD_STYLE = Style.parse("bold green")
 except ImportError:
     print("Rich is not installed. Using simple text interface.")
     
     # Create simple fallbacks for rich components
     class SimpleConsole:
+        # Matches rich style tags such as [bold], [/yellow] and [bold green]
+        _TAG_RE = re.compile(
+            r'\[/?(?:bold|italic|green|blue|red|yellow|cyan|magenta|white)'
+            r'(?: (?:bold|italic|green|blue|red|yellow|cyan|magenta|white))*\]'
+        )
+        
         def print(self, *args, **kwargs):
-            # Strip rich formatting
-            text = str(args[0])
-            for tag in ['[bold]', '[/bold]', '[italic]', '[/italic]', '[green]', '[/green]', 
-                       '[blue]', '[/blue]', '[red]', '[/red]', '[yellow]', '[/yellow]',
-                       '[cyan]', '[/cyan]', '[magenta]', '[/magenta]', '[white]', '[/white]']:
-                text = text.replace(tag, '')
+            # Strip rich formatting in a single pass
+            text = self._TAG_RE.sub('', str(args[0]))
             print(text)
         
         def status(self, text):
@@ -121,6 +147,13 @@ except ImportError:
             traceback.print_exc()
     
     class SimplePanel:
+        def __init__(self, renderable="", title=None, **kwargs):
+            self.renderable = renderable
+            self.title = title
+        
+        def __str__(self):
+            return str(self.renderable)
+        
         @staticmethod
         def fit(text, **kwargs):
             return text
@@ -157,15 +190,41 @@ except ImportError:
     class SimpleText:
         def __init__(self):
             self.content = ""
-            self.plain = ""
+            self.spans = []
+            self._pending = []
+        
+        def __str__(self):
+            return self.content
+        
+        @property
+        def plain(self):
+            return self.content
+        
+        @plain.setter
+        def plain(self, text):
+            # Replacing the text writes it out on the next flush
+            self.content = text
+            self._pending.append(text)
         
         def append(self, text, **kwargs):
             self.content += text
-            self.plain += text
-            print(text, end="")
+            self._pending.append(text)
+        
+        def flush(self):
+            # Emit everything appended since the last flush in one write
+            sys.stdout.write("".join(self._pending))
+            sys.stdout.flush()
+            self._pending.clear()
     
-    class SimpleLayout:
-        def __init__(self):
+    class SimpleLayoutSection:
+        def update(self, content):
+            if getattr(content, 'title', None):
+                console.print(f"\n--- {content.title} ---")
+            console.print(content)
+    
+    class SimpleLayout(SimpleLayoutSection):
+        def __init__(self, renderable=None, name=None, **kwargs):
+            self.name = name
             self.sections = {}
         
         def split(self, *args):
@@ -175,12 +234,6 @@ except ImportError:
         def __getitem__(self, key):
             return self.sections.get(key, SimpleLayoutSection())
     
-    class SimpleLayoutSection:
-        def update(self, content):
-            if hasattr(content, 'title'):
-                print(f"\n--- {content.title} ---")
-            print(content)
-    
     class SimpleLive:
         def __init__(self, content, **kwargs):
             self.content = content
@@ -190,6 +243,9 @@ except ImportError:
         
         def __exit__(self, *args):
             pass
+        
+        def refresh(self):
+            pass
     
     class SimpleAlign:
         @staticmethod
@@ -206,21 +262,26 @@ except ImportError:
     Layout = SimpleLayout
     Live = SimpleLive
     Align = SimpleAlign
-    Box = type('SimpleBox', (), {})
-    Progress = type('SimpleProgress', (), {})
-    SpinnerColumn = type('SimpleSpinnerColumn', (), {})
-    TextColumn = type('SimpleTextColumn', (), {})
-    BarColumn = type('SimpleBarColumn', (), {})
-    TimeElapsedColumn = type('SimpleTimeElapsedColumn', (), {})
+
+# Prefer in-process playback through PortAudio
+try:
+    import sounddevice as sd
+    import soundfile as sf
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    # sounddevice raises OSError when the PortAudio library itself is missing
+    print("sounddevice is not available. Falling back to playsound.")
 
 # Try to import playsound or create a fallback
 try:
     from playsound import playsound
     PLAYSOUND_AVAILABLE = True
+    stop_playsound = None
 except ImportError:
+    stop_playsound = None
     try:
         # Try to use our fallback module
-        from fallback import playsound
+        from fallback import playsound, stop as stop_playsound
         print("Using fallback playsound module with ffplay")
         PLAYSOUND_AVAILABLE = True
     except ImportError:
@@ -230,113 +291,440 @@ except ImportError:
             print(f"[Audio playback disabled] Would play: {sound_file}")
             return True
 
+PYDUB_AVAILABLE = importlib.util.find_spec("pydub") is not None
+if not PYDUB_AVAILABLE:
+    print("Pydub is not installed. Some features will be limited.")
+
 try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    print("Pydub is not installed. Some features will be limited.")
-    # Create a mock AudioSegment
-    class MockAudioSegment:
-        pass
-    
-    class MockPydub:
-        AudioSegment = MockAudioSegment
-    
-    pydub = MockPydub()
+    print("NumPy is not installed. Audio will be converted through a temporary WAV file.")
+
+# PyAV is only needed when decoding for transcription, so it is imported on first use;
+# otherwise audio is decoded by an ffmpeg subprocess instead
+AV_AVAILABLE = importlib.util.find_spec("av") is not None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # The standard library json module is used instead
+    pass
 
 # Initialize console
 console = Console()
 
+# File extensions recognised as audio in the audio directory
+AUDIO_EXTS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.opus', '.aac'})
+
+# Formats the playsound package can play on every platform
+PLAYSOUND_EXTS = frozenset({'.mp3', '.wav'})
+
+# Input options that cap ffmpeg's stream probing at 32 KB and 100 ms of audio
+# (instead of 5 MB and 5 s) and let it decode on all cores
+FFMPEG_INPUT_OPTIONS = {"analyzeduration": "100000", "probesize": "32k", "threads": "0"}
+FFMPEG_INPUT_ARGS = [arg for key, value in FFMPEG_INPUT_OPTIONS.items() for arg in (f"-{key}", value)]
+
+# Resample with libsoxr instead of swresample's default engine, when ffmpeg has it
+SOXR_FILTER = "aresample=16000:resampler=soxr:precision=20"
+
+# Number of converted WAV files kept in the temp directory
+WAV_CACHE_SIZE = 8
+
+# Transcription backends, in the order --backend auto tries them
+BACKENDS = ("faster-whisper", "whisper", "transformers")
+
+# distil-whisper keeps the large-v3 encoder but only two decoder layers
+DISTIL_WHISPER_MODEL = "distil-whisper/distil-large-v3"
+
+def save_json_stream(path, items, pretty: bool = False) -> None:
+    """Write an iterable as a JSON array one record at a time, compact unless pretty is set."""
+    if ORJSON_AVAILABLE:
+        # Whisper timestamps may be NumPy floats, which orjson only accepts with this option
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        dumps = lambda item: orjson.dumps(item, option=option)
+    elif pretty:
+        dumps = lambda item: json.dumps(item, ensure_ascii=False, indent=2).encode("utf-8")
+    else:
+        dumps = lambda item: json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    if pretty:
+        # Lay the array out like json.dump(indent=2): one indented record per line
+        start, separator, end = b"[\n  ", b",\n  ", b"\n]\n"
+        encode = lambda item: dumps(item).replace(b"\n", b"\n  ")
+    else:
+        start, separator, end = b"[", b",", b"]"
+        encode = dumps
+    
+    # Write to a partial file so an interrupted run never leaves truncated JSON behind
+    part_path = f"{path}.part"
+    with open(part_path, "wb", buffering=1 << 16) as f:
+        written = False
+        for item in items:
+            f.write(separator if written else start)
+            f.write(encode(item))
+            written = True
+        f.write(end if written else b"[]")
+    os.replace(part_path, path)
+
+def load_json(path):
+    """Read a JSON file, using orjson when it is available."""
+    with open(path, "rb") as f:
+        content = f.read()
+    return orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+
+def timings_path(json_path) -> Path:
+    """Return the path of the NumPy timing sidecar for a lyrics JSON file."""
+    return Path(json_path).with_suffix(".npz")
+
+def save_timings(json_path, starts, ends, words) -> None:
+    """Save word timings next to a lyrics JSON file as contiguous NumPy arrays."""
+    path = timings_path(json_path)
+    part_path = f"{path}.part"
+    with open(part_path, "wb") as f:
+        np.savez(
+            f,
+            starts=np.asarray(starts, dtype=np.float32),
+            ends=np.asarray(ends, dtype=np.float32),
+            words=np.array(words, dtype=str)
+        )
+    os.replace(part_path, path)
+
+def load_timings(json_path):
+    """Load (starts, ends, words) from the timing sidecar, or None if it is missing or stale."""
+    path = timings_path(json_path)
+    if not NUMPY_AVAILABLE or not path.exists():
+        return None
+    # A JSON file written or edited after the sidecar takes precedence
+    if path.stat().st_mtime < os.stat(json_path).st_mtime:
+        return None
+    try:
+        with np.load(path) as data:
+            return data["starts"].astype(np.float64), data["ends"].astype(np.float64), data["words"].tolist()
+    except Exception:
+        return None
+
+def copy_lyrics(source, destination, pretty: Optional[bool] = None) -> None:
+    """Copy a lyrics JSON file together with its timing sidecar, if there is one.
+    
+    With pretty left as None the JSON is copied byte for byte; True or False
+    re-encodes it indented or compact.
+    """
+    if pretty is None:
+        shutil.copyfile(source, destination)
+    else:
+        save_json_stream(destination, load_json(source), pretty=pretty)
+    # Copied after the JSON so the sidecar is never older than it
+    if timings_path(source).exists():
+        shutil.copyfile(timings_path(source), timings_path(destination))
+
 # ASCII Art generator function
-def generate_ascii_art(text, style="standard"):
-    """Generate ASCII art text for display"""
-    # Simple ASCII art styles
-    styles = {
-        "standard": {
-            'A': [' ▄▄▄▄▄ ', '█     █', '███████', '█     █', '█     █'],
-            'B': ['██████ ', '█     █', '██████ ', '█     █', '██████ '],
-            'C': [' █████ ', '█     █', '█      ', '█     █', ' █████ '],
-            'D': ['██████ ', '█     █', '█     █', '█     █', '██████ '],
-            'E': ['███████', '█      ', '█████  ', '█      ', '███████'],
-            'F': ['███████', '█      ', '█████  ', '█      ', '█      '],
-            'G': [' █████ ', '█      ', '█   ███', '█     █', ' █████ '],
-            'H': ['█     █', '█     █', '███████', '█     █', '█     █'],
-            'I': ['███████', '   █   ', '   █   ', '   █   ', '███████'],
-            'J': ['███████', '     █ ', '     █ ', '█    █ ', ' ████  '],
-            'K': ['█    █ ', '█   █  ', '████   ', '█   █  ', '█    █ '],
-            'L': ['█      ', '█      ', '█      ', '█      ', '███████'],
-            'M': ['█     █', '██   ██', '█ █ █ █', '█  █  █', '█     █'],
-            'N': ['█     █', '██    █', '█ █   █', '█  █  █', '█   ███'],
-            'O': [' █████ ', '█     █', '█     █', '█     █', ' █████ '],
-            'P': ['██████ ', '█     █', '██████ ', '█      ', '█      '],
-            'Q': [' █████ ', '█     █', '█     █', '█   █ █', ' ████ █'],
-            'R': ['██████ ', '█     █', '██████ ', '█   █  ', '█    █ '],
-            'S': [' █████ ', '█      ', ' █████ ', '      █', '██████ '],
-            'T': ['███████', '   █   ', '   █   ', '   █   ', '   █   '],
-            'U': ['█     █', '█     █', '█     █', '█     █', ' █████ '],
-            'V': ['█     █', '█     █', '█     █', ' █   █ ', '  ███  '],
-            'W': ['█     █', '█     █', '█  █  █', '█ █ █ █', '██   ██'],
-            'X': ['█     █', ' █   █ ', '  ███  ', ' █   █ ', '█     █'],
-            'Y': ['█     █', ' █   █ ', '  ███  ', '   █   ', '   █   '],
-            'Z': ['███████', '    █  ', '   █   ', '  █    ', '███████'],
-            ' ': ['       ', '       ', '       ', '       ', '       '],
-            '!': ['   █   ', '   █   ', '   █   ', '       ', '   █   '],
-            '?': [' █████ ', '█     █', '    ██ ', '       ', '   █   '],
-            '.': ['       ', '       ', '       ', '       ', '   █   '],
-            ',': ['       ', '       ', '       ', '   █   ', '  █    '],
-            '0': [' █████ ', '█     █', '█     █', '█     █', ' █████ '],
-            '1': ['   █   ', '  ██   ', '   █   ', '   █   ', '███████'],
-            '2': [' █████ ', '█     █', '    ██ ', '  ██   ', '███████'],
-            '3': [' █████ ', '      █', '   ███ ', '      █', ' █████ '],
-            '4': ['█    █ ', '█    █ ', '███████', '     █ ', '     █ '],
-            '5': ['███████', '█      ', '██████ ', '      █', '██████ '],
-            '6': [' █████ ', '█      ', '██████ ', '█     █', ' █████ '],
-            '7': ['███████', '     █ ', '    █  ', '   █   ', '  █    '],
-            '8': [' █████ ', '█     █', ' █████ ', '█     █', ' █████ '],
-            '9': [' █████ ', '█     █', ' ██████', '      █', ' █████ '],
-            '-': ['       ', '       ', '███████', '       ', '       '],
-            '_': ['       ', '       ', '       ', '       ', '███████'],
-            '+': ['       ', '   █   ', ' █████ ', '   █   ', '       '],
-            '=': ['       ', ' █████ ', '       ', ' █████ ', '       '],
-            '*': ['       ', ' █ █ █ ', '  ███  ', ' █ █ █ ', '       '],
-            '/': ['      █', '     █ ', '    █  ', '   █   ', '  █    '],
-            '\\': ['█      ', ' █     ', '  █    ', '   █   ', '    █  '],
-            '(': ['    █  ', '   █   ', '   █   ', '   █   ', '    █  '],
-            ')': ['  █    ', '   █   ', '   █   ', '   █   ', '  █    '],
-            '[': ['  ████ ', '  █    ', '  █    ', '  █    ', '  ████ '],
-            ']': [' ████  ', '    █  ', '    █  ', '    █  ', ' ████  '],
-            '{': ['    ██ ', '   █   ', '  ██   ', '   █   ', '    ██ '],
-            '}': [' ██    ', '   █   ', '   ██  ', '   █   ', ' ██    '],
-            '|': ['   █   ', '   █   ', '   █   ', '   █   ', '   █   '],
-            ':': ['       ', '   █   ', '       ', '   █   ', '       '],
-            ';': ['       ', '   █   ', '       ', '   █   ', '  █    '],
-            '"': [' █   █ ', ' █   █ ', '       ', '       ', '       '],
-            "'": ['   █   ', '   █   ', '       ', '       ', '       '],
-            '`': ['   █   ', '    █  ', '       ', '       ', '       '],
-            '~': ['       ', '  █  █ ', ' █ █   ', '       ', '       '],
-            '^': ['   █   ', '  █ █  ', '       ', '       ', '       '],
-            '&': ['  ██   ', ' █  █  ', '  ██ █ ', ' █  █  ', '  ██ █ '],
-            '@': [' ████  ', '█    █ ', '█ ████ ', '█      ', ' ████  '],
-            '#': [' █   █ ', '███████', ' █   █ ', '███████', ' █   █ '],
-            '$': ['   █   ', ' █████ ', '█      ', ' █████ ', '   █   '],
-            '%': ['██   █ ', '██  █  ', '   █   ', '  █  ██', ' █   ██'],
-        }
+# Simple ASCII art styles
+ASCII_STYLES = {
+    "standard": {
+        'A': [' ▄▄▄▄▄ ', '█     █', '███████', '█     █', '█     █'],
+        'B': ['██████ ', '█     █', '██████ ', '█     █', '██████ '],
+        'C': [' █████ ', '█     █', '█      ', '█     █', ' █████ '],
+        'D': ['██████ ', '█     █', '█     █', '█     █', '██████ '],
+        'E': ['███████', '█      ', '█████  ', '█      ', '███████'],
+        'F': ['███████', '█      ', '█████  ', '█      ', '█      '],
+        'G': [' █████ ', '█      ', '█   ███', '█     █', ' █████ '],
+        'H': ['█     █', '█     █', '███████', '█     █', '█     █'],
+        'I': ['███████', '   █   ', '   █   ', '   █   ', '███████'],
+        'J': ['███████', '     █ ', '     █ ', '█    █ ', ' ████  '],
+        'K': ['█    █ ', '█   █  ', '████   ', '█   █  ', '█    █ '],
+        'L': ['█      ', '█      ', '█      ', '█      ', '███████'],
+        'M': ['█     █', '██   ██', '█ █ █ █', '█  █  █', '█     █'],
+        'N': ['█     █', '██    █', '█ █   █', '█  █  █', '█   ███'],
+        'O': [' █████ ', '█     █', '█     █', '█     █', ' █████ '],
+        'P': ['██████ ', '█     █', '██████ ', '█      ', '█      '],
+        'Q': [' █████ ', '█     █', '█     █', '█   █ █', ' ████ █'],
+        'R': ['██████ ', '█     █', '██████ ', '█   █  ', '█    █ '],
+        'S': [' █████ ', '█      ', ' █████ ', '      █', '██████ '],
+        'T': ['███████', '   █   ', '   █   ', '   █   ', '   █   '],
+        'U': ['█     █', '█     █', '█     █', '█     █', ' █████ '],
+        'V': ['█     █', '█     █', '█     █', ' █   █ ', '  ███  '],
+        'W': ['█     █', '█     █', '█  █  █', '█ █ █ █', '██   ██'],
+        'X': ['█     █', ' █   █ ', '  ███  ', ' █   █ ', '█     █'],
+        'Y': ['█     █', ' █   █ ', '  ███  ', '   █   ', '   █   '],
+        'Z': ['███████', '    █  ', '   █   ', '  █    ', '███████'],
+        ' ': ['       ', '       ', '       ', '       ', '       '],
+        '!': ['   █   ', '   █   ', '   █   ', '       ', '   █   '],
+        '?': [' █████ ', '█     █', '    ██ ', '       ', '   █   '],
+        '.': ['       ', '       ', '       ', '       ', '   █   '],
+        ',': ['       ', '       ', '       ', '   █   ', '  █    '],
+        '0': [' █████ ', '█     █', '█     █', '█     █', ' █████ '],
+        '1': ['   █   ', '  ██   ', '   █   ', '   █   ', '███████'],
+        '2': [' █████ ', '█     █', '    ██ ', '  ██   ', '███████'],
+        '3': [' █████ ', '      █', '   ███ ', '      █', ' █████ '],
+        '4': ['█    █ ', '█    █ ', '███████', '     █ ', '     █ '],
+        '5': ['███████', '█      ', '██████ ', '      █', '██████ '],
+        '6': [' █████ ', '█      ', '██████ ', '█     █', ' █████ '],
+        '7': ['███████', '     █ ', '    █  ', '   █   ', '  █    '],
+        '8': [' █████ ', '█     █', ' █████ ', '█     █', ' █████ '],
+        '9': [' █████ ', '█     █', ' ██████', '      █', ' █████ '],
+        '-': ['       ', '       ', '███████', '       ', '       '],
+        '_': ['       ', '       ', '       ', '       ', '███████'],
+        '+': ['       ', '   █   ', ' █████ ', '   █   ', '       '],
+        '=': ['       ', ' █████ ', '       ', ' █████ ', '       '],
+        '*': ['       ', ' █ █ █ ', '  ███  ', ' █ █ █ ', '       '],
+        '/': ['      █', '     █ ', '    █  ', '   █   ', '  █    '],
+        '\\': ['█      ', ' █     ', '  █    ', '   █   ', '    █  '],
+        '(': ['    █  ', '   █   ', '   █   ', '   █   ', '    █  '],
+        ')': ['  █    ', '   █   ', '   █   ', '   █   ', '  █    '],
+        '[': ['  ████ ', '  █    ', '  █    ', '  █    ', '  ████ '],
+        ']': [' ████  ', '    █  ', '    █  ', '    █  ', ' ████  '],
+        '{': ['    ██ ', '   █   ', '  ██   ', '   █   ', '    ██ '],
+        '}': [' ██    ', '   █   ', '   ██  ', '   █   ', ' ██    '],
+        '|': ['   █   ', '   █   ', '   █   ', '   █   ', '   █   '],
+        ':': ['       ', '   █   ', '       ', '   █   ', '       '],
+        ';': ['       ', '   █   ', '       ', '   █   ', '  █    '],
+        '"': [' █   █ ', ' █   █ ', '       ', '       ', '       '],
+        "'": ['   █   ', '   █   ', '       ', '       ', '       '],
+        '`': ['   █   ', '    █  ', '       ', '       ', '       '],
+        '~': ['       ', '  █  █ ', ' █ █   ', '       ', '       '],
+        '^': ['   █   ', '  █ █  ', '       ', '       ', '       '],
+        '&': ['  ██   ', ' █  █  ', '  ██ █ ', ' █  █  ', '  ██ █ '],
+        '@': [' ████  ', '█    █ ', '█ ████ ', '█      ', ' ████  '],
+        '#': [' █   █ ', '███████', ' █   █ ', '███████', ' █   █ '],
+        '$': ['   █   ', ' █████ ', '█      ', ' █████ ', '   █   '],
+        '%': ['██   █ ', '██  █  ', '   █   ', '  █  ██', ' █   ██'],
     }
-    
+}
+
+# Glyph rows of each style as a (128, 5, 7) array of codepoints indexed by the
+# character's own codepoint, so a whole string renders with a single gather;
+# characters without a glyph map to the space glyph
+ASCII_GLYPHS = {}
+if NUMPY_AVAILABLE:
+    for _name, _style in ASCII_STYLES.items():
+        _font = np.empty((128, 5, 7), dtype=np.uint32)
+        _font[:] = [[ord(c) for c in row] for row in _style[" "]]
+        for _char, _rows in _style.items():
+            _font[ord(_char)] = [[ord(c) for c in row] for row in _rows]
+        ASCII_GLYPHS[_name] = _font
+
+@functools.lru_cache(maxsize=4096)
+def generate_ascii_art(text, style="standard"):
+    """Generate ASCII art text for display as five newline-separated lines"""
     # Convert text to uppercase for ASCII art
     text = text.upper()
     
+    if style in ASCII_GLYPHS and text:
+        glyphs = ASCII_GLYPHS[style]
+        codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        idx = np.where(codepoints < len(glyphs), codepoints, ord(" "))
+        # [chars, rows, cols] -> [rows, chars * cols + newline], then read it all as one string
+        block = glyphs[idx].transpose(1, 0, 2).reshape(5, -1)
+        rows = np.empty((5, block.shape[1] + 1), dtype=np.uint32)
+        rows[:, :-1] = block
+        rows[:, -1] = ord("\n")
+        return rows.reshape(1, -1).view(f"<U{rows.size}").item()[:-1]
+    
     # Get the selected style or default to standard
-    style_dict = styles.get(style, styles["standard"])
+    style_dict = ASCII_STYLES.get(style, ASCII_STYLES["standard"])
+    
+    # Generate ASCII art lines, joining each row once
+    glyphs = [style_dict.get(char, style_dict[" "]) for char in text]
+    return "\n".join("".join(glyph[i] for glyph in glyphs) for i in range(5))
+
+# Titles of the UI screens, rendered once at import
+TITLE_ART = {
+    name: generate_ascii_art(name).split("\n")
+    for name in ("LYRICS GENERATOR", "MAIN MENU", "AUDIO FILES", "SELECT FILE")
+}
+
+def iter_lyrics(words) -> Iterator[Dict[str, Any]]:
+    """Yield lyric entries from word dicts with timestamps."""
+    return (
+        {
+            "word": word["word"].strip(),
+            "start": word["start"],
+            "end": word["end"]
+        }
+        for word in words
+    )
+
+@functools.lru_cache(maxsize=None)
+def load_whisper_model(backend: str, name: str, model_dir: str):
+    """Load a Whisper model for the given backend once per process."""
+    if backend == "transformers":
+        import torch
+        from transformers import pipeline
+        
+        # fp16 on the GPU, with flash attention when flash-attn is installed and
+        # torch's fused attention kernels otherwise
+        cuda = torch.cuda.is_available()
+        attention = "flash_attention_2" if cuda and importlib.util.find_spec("flash_attn") else "sdpa"
+        return pipeline(
+            "automatic-speech-recognition",
+            name,
+            torch_dtype=torch.float16 if cuda else torch.float32,
+            device="cuda:0" if cuda else "cpu",
+            model_kwargs={"attn_implementation": attention}
+        )
+    if backend == "faster-whisper":
+        import ctranslate2
+        from faster_whisper import WhisperModel
+        
+        # CTranslate2 int8 kernels, with fp16 activations when a GPU is present;
+        # the converted model is kept in model_dir
+        cuda = ctranslate2.get_cuda_device_count() > 0
+        return WhisperModel(
+            name,
+            device="auto",
+            compute_type="int8_float16" if cuda else "int8",
+            cpu_threads=os.cpu_count() or 0,
+            download_root=model_dir
+        )
+    import whisper
+    if TORCH_AVAILABLE:
+        import torch
+    
+    model = whisper.load_model(name)
+    if TORCH_AVAILABLE and torch.cuda.is_available():
+        # Keep fp16 weights so decoding skips the per-call fp32 -> fp16 cast;
+        # whisper's LayerNorm computes in fp32 and needs fp32 weights
+        model = model.half()
+        for module in model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+    if TORCH_AVAILABLE and torch.cuda.is_available() and hasattr(torch, "compile"):
+        # The encoder always sees a fixed 30s mel window, so it can be captured
+        # into CUDA graphs; keep the inductor cache on disk to skip recompiles
+        os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(model_dir, "inductor"))
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+    elif TORCH_AVAILABLE:
+        torch.set_num_threads(os.cpu_count() or 1)
+        model = quantize_model(model)
+    return model
+
+def quantize_model(model):
+    """Quantize the Linear layers of a CPU Whisper model to int8."""
+    import torch
+    
+    engine = "qnnpack" if platform.machine().lower() in ("arm64", "aarch64") else "fbgemm"
+    if engine not in torch.backends.quantized.supported_engines:
+        return model
+    
+    try:
+        torch.backends.quantized.engine = engine
+        for module in model.modules():
+            # whisper subclasses nn.Linear only to cast weights in forward(), which
+            # is a no-op on CPU, but quantize_dynamic only matches the exact type
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        console.print(f"[yellow]Could not quantize Whisper model:[/yellow] {str(e)}")
+        return model
+
+def decode_with_av(audio_path: str, sample_rate: int):
+    """Decode an audio file to mono int16 samples with PyAV."""
+    import av
+    
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    chunks = []
+    with av.open(audio_path) as container:
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray())
+    # Drain the samples still buffered in the resampler
+    for resampled in resampler.resample(None):
+        chunks.append(resampled.to_ndarray())
+    
+    if not chunks:
+        return np.zeros(0, dtype=np.int16)
+    return np.concatenate(chunks, axis=1).ravel()
+
+@functools.lru_cache(maxsize=None)
+def load_vad_model():
+    """Load the Silero VAD model and its speech timestamp helper once per process.
     
-    # Generate ASCII art lines
-    lines = ["", "", "", "", ""]
-    for char in text:
-        char_art = style_dict.get(char, style_dict[" "])
-        for i in range(5):
-            lines[i] += char_art[i]
+    Returns None if the silero-vad package is missing or the model cannot be
+    loaded; the failure is remembered so it is only attempted, and reported, once.
+    """
+    if not SILERO_VAD_AVAILABLE:
+        return None
+    try:
+        # The silero-vad package ships the model weights, so nothing is fetched
+        from silero_vad import load_silero_vad, get_speech_timestamps
+        return load_silero_vad(), get_speech_timestamps
+    except Exception as e:
+        console.print(f"[yellow]Could not load the voice activity detector:[/yellow] {str(e)}")
+        return None
+
+def trim_silence(audio, sample_rate: int):
+    """Drop non-speech stretches from audio with Silero VAD.
+    
+    Returns the trimmed audio and a (trimmed_starts, shifts) pair of arrays that
+    map a time in the trimmed audio back to the original, or None if nothing
+    was trimmed.
+    """
+    import torch
+    
+    vad = load_vad_model()
+    if vad is None:
+        return audio, None
+    try:
+        vad_model, get_speech_timestamps = vad
+        speech = get_speech_timestamps(torch.from_numpy(audio), vad_model, sampling_rate=sample_rate)
+    except Exception as e:
+        console.print(f"[yellow]Could not detect speech, transcribing the whole track:[/yellow] {str(e)}")
+        return audio, None
+    if not speech:
+        return audio, None
     
-    return lines
+    trimmed_starts = array.array('d')
+    shifts = array.array('d')
+    position = 0
+    for region in speech:
+        trimmed_starts.append(position / sample_rate)
+        shifts.append((region["start"] - position) / sample_rate)
+        position += region["end"] - region["start"]
+    trimmed = np.concatenate([audio[region["start"]:region["end"]] for region in speech])
+    return trimmed, (trimmed_starts, shifts)
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    """Return a BLAKE2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def is_whisper_wav(path) -> bool:
+    """Return whether a file is already a 16kHz mono 16-bit PCM WAV."""
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getframerate() == 16000 and wav.getnchannels() == 1 and wav.getsampwidth() == 2
+    except (wave.Error, EOFError, OSError):
+        return False
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_output_options(ffmpeg_path: str) -> Dict[str, str]:
+    """Return the output options for 16kHz mono PCM, using soxr if this ffmpeg build has it."""
+    try:
+        version = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-version"],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        version = ""
+    options = {"acodec": "pcm_s16le", "ac": "1", "ar": "16000"}
+    if "--enable-libsoxr" in version:
+        options["af"] = SOXR_FILTER
+    return options
+
+def ffmpeg_output_args(ffmpeg_path: str) -> List[str]:
+    """Return ffmpeg_output_options() as command line arguments."""
+    return [arg for key, value in ffmpeg_output_options(ffmpeg_path).items() for arg in (f"-{key}", value)]
+
+@functools.lru_cache(maxsize=64)
+def probe_duration(path: str, mtime: float) -> float:
+    """Return an audio file's duration in seconds, probed once per file version."""
+    return float(ffmpeg.probe(path)['format']['duration'])
 
 class LyricGenerator:
     """Main class for the Automatic Lyrics Generator application."""
@@ -360,18 +748,32 @@ class LyricGenerator:
         self.output_dir = self.base_dir / "output"
         self.audio_dir = self.base_dir / "audio"
         self.temp_dir = self.base_dir / "temp"
+        self.model_dir = self.base_dir / "models"
+        self.cache_dir = self.output_dir / "cache"
+        # None picks the backend's default model
+        self.model_name = None
+        self.backend = "auto"
+        self.batch_size = 16
+        self.pretty_json = False
         self.model = None
-        self.lyrics = []
+        # (backend, model name) that self.model was loaded for
+        self._model_key = None
+        # Background model load as (model key, future)
+        self._model_load = None
+        self.preload_model = True
+        self.ffmpeg_path = shutil.which("ffmpeg") or "ffmpeg"
+        # Parsed lyrics by JSON path, as (mtime, timings)
+        self.lyrics_cache = {}
         
-        # Create necessary directories
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(self.audio_dir, exist_ok=True)
-        os.makedirs(self.temp_dir, exist_ok=True)
+        # Create necessary directories; the cache lives inside output, so it comes first
+        for directory in (self.cache_dir, self.audio_dir, self.temp_dir, self.model_dir):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
     
     def display_welcome(self) -> None:
         """Display welcome message and application info."""
         # Generate ASCII art for the title
-        title_art = generate_ascii_art("LYRICS GENERATOR")
+        title_art = TITLE_ART["LYRICS GENERATOR"]
         
         # Display the ASCII art title
         for line in title_art:
@@ -390,9 +792,11 @@ class LyricGenerator:
         status_table.add_column(style="yellow")
         status_table.add_column(style="green")
         status_table.add_row("Whisper:", "Available ✓" if WHISPER_AVAILABLE else "Not Available ✗")
+        status_table.add_row("Faster-Whisper:", "Available ✓" if FASTER_WHISPER_AVAILABLE else "Not Available ✗")
+        status_table.add_row("Transformers:", "Available ✓" if TRANSFORMERS_AVAILABLE else "Not Available ✗")
         status_table.add_row("FFmpeg:", "Available ✓" if FFMPEG_AVAILABLE else "Not Available ✗")
         status_table.add_row("Rich UI:", "Available ✓" if RICH_AVAILABLE else "Not Available ✗")
-        status_table.add_row("Audio Playback:", "Available ✓" if PLAYSOUND_AVAILABLE else "Not Available ✗")
+        status_table.add_row("Audio Playback:", "Available ✓" if SOUNDDEVICE_AVAILABLE or PLAYSOUND_AVAILABLE else "Not Available ✗")
         status_table.add_row("PyDub:", "Available ✓" if PYDUB_AVAILABLE else "Not Available ✗")
         console.print(status_table)
         
@@ -410,7 +814,7 @@ class LyricGenerator:
     def show_main_menu(self) -> str:
         """Display the main menu and return the selected option."""
         # Generate ASCII art for the menu title
-        menu_art = generate_ascii_art("MAIN MENU")
+        menu_art = TITLE_ART["MAIN MENU"]
         
         # Display the ASCII art menu title
         for line in menu_art:
@@ -430,20 +834,23 @@ class LyricGenerator:
         choice = Prompt.ask("\n[bold]Choose an option[/bold]", choices=[str(i) for i in range(1, len(options) + 1)])
         return choice
     
-    def list_audio_files(self) -> List[str]:
-        """List all audio files in the audio directory."""
-        audio_files = []
-        for file in os.listdir(self.audio_dir):
-            if file.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a')):
-                audio_files.append(file)
-        return audio_files
+    def list_audio_files(self) -> List[Tuple[str, int]]:
+        """List all audio files in the audio directory with their sizes."""
+        # scandir entries carry the stat info, so sizes need no extra syscalls
+        with os.scandir(self.audio_dir) as entries:
+            return [
+                (entry.name, entry.stat().st_size)
+                for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTS
+            ]
     
-    def display_audio_files(self) -> None:
-        """Display a table of available audio files."""
-        audio_files = self.list_audio_files()
+    def display_audio_files(self, audio_files: Optional[List[Tuple[str, int]]] = None) -> None:
+        """Display a table of available audio files, listing them unless given."""
+        if audio_files is None:
+            audio_files = self.list_audio_files()
         
         # Generate ASCII art for the title
-        files_art = generate_ascii_art("AUDIO FILES")
+        files_art = TITLE_ART["AUDIO FILES"]
         
         # Display the ASCII art title
         for line in files_art:
@@ -459,9 +866,7 @@ class LyricGenerator:
         table.add_column("Filename", style="green")
         table.add_column("Size", style="magenta")
         
-        for i, file in enumerate(audio_files, 1):
-            file_path = self.audio_dir / file
-            size = os.path.getsize(file_path)
+        for i, (file, size) in enumerate(audio_files, 1):
             size_str = f"{size / 1024 / 1024:.2f} MB" if size > 1024 * 1024 else f"{size / 1024:.2f} KB"
             table.add_row(str(i), file, size_str)
         
@@ -472,7 +877,7 @@ class LyricGenerator:
         audio_files = self.list_audio_files()
         
         # Generate ASCII art for the title
-        select_art = generate_ascii_art("SELECT FILE")
+        select_art = TITLE_ART["SELECT FILE"]
         
         # Display the ASCII art title
         for line in select_art:
@@ -483,54 +888,248 @@ class LyricGenerator:
             console.print(f"Please add audio files to the [bold]{self.audio_dir}[/bold] directory.")
             return None
         
-        self.display_audio_files()
+        # Show the same listing the choice is made from
+        self.display_audio_files(audio_files)
         
         choice = Prompt.ask(
             "\n[bold]Select a file by ID[/bold]", 
             choices=[str(i) for i in range(1, len(audio_files) + 1)]
         )
         
-        selected_file = audio_files[int(choice) - 1]
+        selected_file = audio_files[int(choice) - 1][0]
         self.audio_path = str(self.audio_dir / selected_file)
         console.print(f"[green]Selected:[/green] {selected_file}")
         return self.audio_path
     
     def convert_audio_to_wav(self, audio_path: str) -> str:
-        """Convert audio file to WAV format for processing."""
-        output_path = str(self.temp_dir / "temp_audio.wav")
+        """Convert audio file to WAV format for processing, reusing earlier conversions."""
+        if is_whisper_wav(audio_path):
+            # Already in the format Whisper reads, so there is nothing to convert
+            return audio_path
+        
+        # Key conversions by source path, modification time and size
+        stat = os.stat(audio_path)
+        key = hashlib.blake2b(
+            f"{os.path.abspath(audio_path)}:{stat.st_mtime}:{stat.st_size}".encode("utf-8"),
+            digest_size=8
+        ).hexdigest()
+        output_path = str(self.temp_dir / f"cache_{key}.wav")
+        if os.path.exists(output_path):
+            # Mark as recently used for eviction
+            os.utime(output_path)
+            return output_path
         
+        # Write to a partial file so a failed conversion is never reused
+        part_path = str(self.temp_dir / f"cache_{key}.part.wav")
         with console.status("[bold green]Converting audio to WAV format..."):
             try:
                 if FFMPEG_AVAILABLE:
                     # Use ffmpeg to convert to WAV with proper settings for Whisper
-                    ffmpeg.input(audio_path).output(
-                        output_path, 
-                        acodec='pcm_s16le',
-                        ac=1,  # mono
-                        ar=16000  # 16kHz sample rate
-                    ).run(quiet=True, overwrite_output=True)
+                    ffmpeg.input(audio_path, **FFMPEG_INPUT_OPTIONS).output(
+                        part_path, **ffmpeg_output_options(self.ffmpeg_path)
+                    ).run(cmd=self.ffmpeg_path, quiet=True, overwrite_output=True)
                 else:
                     # Try using subprocess to call ffmpeg directly
                     try:
                         subprocess.run([
-                            "ffmpeg", "-i", audio_path, 
-                            "-acodec", "pcm_s16le", 
-                            "-ac", "1", 
-                            "-ar", "16000", 
-                            "-y", output_path
+                            self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                            *FFMPEG_INPUT_ARGS,
+                            "-i", audio_path, 
+                            *ffmpeg_output_args(self.ffmpeg_path),
+                            "-y", part_path
                         ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
                     except subprocess.CalledProcessError:
-                        # If ffmpeg fails, just copy the file as a fallback
-                        import shutil
-                        shutil.copy(audio_path, output_path)
+                        # If ffmpeg fails, just use the original file as a fallback
                         console.print("[yellow]Warning: Using original audio file without conversion[/yellow]")
+                        return audio_path
                 
+                os.replace(part_path, output_path)
+                self.evict_wav_cache()
                 return output_path
             except Exception as e:
                 console.print(f"[bold red]Error converting audio:[/bold red] {str(e)}")
                 # As a last resort, just return the original file
                 return audio_path
     
+    def evict_wav_cache(self) -> None:
+        """Delete the least recently used converted WAV files beyond WAV_CACHE_SIZE."""
+        cached = sorted(
+            (entry for entry in os.scandir(self.temp_dir)
+             if entry.name.startswith("cache_") and entry.name.endswith(".wav")
+             and not entry.name.endswith(".part.wav")),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True
+        )
+        for entry in cached[WAV_CACHE_SIZE:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    
+    def decode_audio(self, audio_path: str):
+        """Decode audio file into a 16kHz mono float32 array for Whisper."""
+        if not NUMPY_AVAILABLE:
+            return None
+        
+        with console.status("[bold green]Decoding audio..."):
+            try:
+                if AV_AVAILABLE:
+                    # Decode and resample inside this process with libav
+                    samples = decode_with_av(audio_path, 16000)
+                elif FFMPEG_AVAILABLE:
+                    # Stream raw PCM from ffmpeg's stdout instead of writing a WAV file
+                    pcm, _ = ffmpeg.input(audio_path, **FFMPEG_INPUT_OPTIONS).output(
+                        "pipe:", format="s16le", **ffmpeg_output_options(self.ffmpeg_path)
+                    ).run(cmd=self.ffmpeg_path, capture_stdout=True, capture_stderr=True)
+                else:
+                    pcm = subprocess.run([
+                        self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                        *FFMPEG_INPUT_ARGS,
+                        "-i", audio_path,
+                        "-f", "s16le",
+                        *ffmpeg_output_args(self.ffmpeg_path),
+                        "pipe:"
+                    ], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
+                
+                if not AV_AVAILABLE:
+                    samples = np.frombuffer(pcm, np.int16)
+            except Exception as e:
+                console.print(f"[yellow]Could not decode audio in memory:[/yellow] {str(e)}")
+                return None
+        
+        # Scale in place so the float32 copy is the only new buffer
+        audio = samples.astype(np.float32)
+        audio *= 1 / 32768.0
+        return audio
+    
+    def resolve_backend(self) -> Optional[str]:
+        """Return the installed transcription backend to use, or None if there is none."""
+        available = {
+            "faster-whisper": FASTER_WHISPER_AVAILABLE,
+            "whisper": WHISPER_AVAILABLE,
+            "transformers": TRANSFORMERS_AVAILABLE
+        }
+        if self.backend != "auto":
+            return self.backend if available[self.backend] else None
+        return next((backend for backend in BACKENDS if available[backend]), None)
+    
+    def backend_model_name(self) -> str:
+        """Return the model the resolved backend loads."""
+        if self.model_name:
+            return self.model_name
+        if self.resolve_backend() == "transformers":
+            return DISTIL_WHISPER_MODEL
+        return "base"
+    
+    def load_model(self):
+        """Load the Whisper model, reusing an already loaded one."""
+        return load_whisper_model(self.resolve_backend(), self.backend_model_name(), str(self.model_dir))
+    
+    def unload_model(self) -> None:
+        """Release the loaded Whisper and VAD models and any GPU memory they held."""
+        self.model = None
+        self._model_key = None
+        self._model_load = None
+        load_whisper_model.cache_clear()
+        load_vad_model.cache_clear()
+        if TORCH_AVAILABLE and "torch" in sys.modules:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+    
+    def start_model_load(self) -> Future:
+        """Start loading the Whisper model on a background thread, once per model."""
+        model_key = (self.resolve_backend(), self.backend_model_name())
+        if self._model_load is not None:
+            key, future = self._model_load
+            # Reuse a load that is running or succeeded; retry one that failed
+            if key == model_key and not (future.done() and future.exception()):
+                return future
+        
+        future = Future()
+        
+        def load():
+            try:
+                future.set_result(self.load_model())
+            except Exception as e:
+                future.set_exception(e)
+        
+        # A daemon thread, so quitting from the menu never waits on a download
+        threading.Thread(target=load, daemon=True).start()
+        self._model_load = (model_key, future)
+        return future
+    
+    def transcribe_words(self, audio):
+        """Transcribe audio and yield word dicts with start and end timestamps."""
+        backend = self.resolve_backend()
+        if backend == "transformers":
+            # Chunk the track into 30s windows and encode a batch of them per pass
+            inputs = audio if isinstance(audio, str) else {"raw": audio, "sampling_rate": 16000}
+            outputs = self.model(
+                inputs, chunk_length_s=30, batch_size=self.batch_size, return_timestamps="word"
+            )
+            for chunk in outputs["chunks"]:
+                start, end = chunk["timestamp"]
+                # The last word of the track can come back without an end time
+                yield {"word": chunk["text"], "start": start, "end": start if end is None else end}
+        elif backend == "faster-whisper":
+            try:
+                # Batched inference was added in faster-whisper 1.1
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                BatchedInferencePipeline = None
+            
+            # Batching only pays off once the audio spans more than one 30s window
+            long_audio = isinstance(audio, str) or len(audio) > 30 * 16000
+            if BatchedInferencePipeline is not None and self.batch_size > 1 and long_audio:
+                # Run the encoder over several 30s windows in one forward pass
+                pipeline = BatchedInferencePipeline(model=self.model)
+                segments, _ = pipeline.transcribe(
+                    audio, batch_size=self.batch_size, word_timestamps=True, vad_filter=True, beam_size=1
+                )
+            else:
+                # Skip silent stretches and decode greedily
+                segments, _ = self.model.transcribe(
+                    audio, word_timestamps=True, vad_filter=True, beam_size=1
+                )
+            for segment in segments:
+                for word in segment.words or []:
+                    yield {"word": word.word, "start": word.start, "end": word.end}
+        else:
+            offsets = None
+            if TORCH_AVAILABLE and not isinstance(audio, str):
+                # openai-whisper has no VAD of its own, so cut silence before encoding
+                audio, offsets = trim_silence(audio, 16000)
+            if TORCH_AVAILABLE:
+                import torch
+                with torch.inference_mode():
+                    result = self.model.transcribe(audio, word_timestamps=True)
+            else:
+                result = self.model.transcribe(audio, word_timestamps=True)
+            for segment in result["segments"]:
+                for word in segment.get("words", []):
+                    if offsets:
+                        # Shift timestamps back onto the untrimmed track
+                        trimmed_starts, shifts = offsets
+                        shift = shifts[max(bisect.bisect_right(trimmed_starts, word["start"]) - 1, 0)]
+                        word = dict(word, start=word["start"] + shift, end=word["end"] + shift)
+                    yield word
+    
+    def write_lyrics(self, json_path, words) -> None:
+        """Stream lyric entries to JSON and save their timings alongside."""
+        starts, ends, texts = array.array('d'), array.array('d'), []
+        
+        def record(items):
+            for item in items:
+                starts.append(item["start"])
+                ends.append(item["end"])
+                texts.append(item["word"])
+                yield item
+        
+        save_json_stream(json_path, record(iter_lyrics(words)), pretty=self.pretty_json)
+        if NUMPY_AVAILABLE:
+            save_timings(json_path, starts, ends, texts)
+    
     def transcribe_audio(self, audio_path=None) -> None:
         """Transcribe audio file to generate lyrics with timestamps."""
         if audio_path:
@@ -540,17 +1139,17 @@ class LyricGenerator:
             console.print("[yellow]No audio file selected. Please select an audio file first.[/yellow]")
             return
         
-        # Convert to WAV for processing
-        wav_path = self.convert_audio_to_wav(self.audio_path)
-        if not wav_path:
-            return
-        
         # Get the base filename without extension
         base_filename = os.path.basename(self.audio_path).rsplit('.', 1)[0]
         output_json_path = self.output_dir / f"{base_filename}_lyrics.json"
         
-        # Check if Whisper is available
-        if not WHISPER_AVAILABLE:
+        # Check if the requested backend is available
+        if self.backend != "auto" and self.resolve_backend() is None:
+            console.print(f"[bold red]Error:[/bold red] The {self.backend} backend is not installed.")
+            return None
+        
+        # Check if a Whisper backend is available
+        if self.resolve_backend() is None:
             console.print("[yellow]Whisper is not available. Creating dummy lyrics for demonstration.[/yellow]")
             
             # Create dummy lyrics
@@ -570,57 +1169,57 @@ class LyricGenerator:
                 {"word": "installed", "start": 9.0, "end": 9.5},
             ]
             
-            # Process results and convert to ASCII art
-            output = []
-            for item in dummy_lyrics:
-                # Generate ASCII art for each word
-                ascii_art = generate_ascii_art(item["word"].strip())
-                ascii_text = "\n".join(ascii_art)
-                
-                output.append({
-                    "word": item["word"].strip(),
-                    "ascii_art": ascii_text,
-                    "start": item["start"],
-                    "end": item["end"]
-                })
+            # Stream to JSON
+            self.write_lyrics(output_json_path, dummy_lyrics)
             
-            # Save to JSON
-            with open(output_json_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            
-            self.lyrics = output
             console.print(f"[bold green]Demo lyrics created![/bold green] Saved to {output_json_path}")
             return output_json_path
         
-        # Load Whisper model
-        with console.status("[bold green]Loading Whisper model...") as status:
+        # Reuse an earlier transcription of identical audio with the same backend
+        # and model; backends decode differently, so they never share entries
+        # Key the model by a digest of its full name or path, which may contain
+        # slashes or drive letters and differ only in a parent directory
+        model_tag = hashlib.blake2b(self.backend_model_name().encode("utf-8"), digest_size=8).hexdigest()
+        cache_path = self.cache_dir / f"{file_digest(self.audio_path)}_{self.resolve_backend()}_{model_tag}.json"
+        if cache_path.exists():
+            # The cache is kept compact, so only --pretty needs re-encoding
+            copy_lyrics(cache_path, output_json_path, pretty=True if self.pretty_json else None)
+            console.print(f"[bold green]Using cached transcription![/bold green] Saved to {output_json_path}")
+            return output_json_path
+        
+        # Load the Whisper model in the background while the audio is decoded,
+        # unless an earlier transcription already loaded the same one
+        model_future = None
+        model_key = (self.resolve_backend(), self.backend_model_name())
+        if self.model is None or self._model_key != model_key:
+            if self.model is not None:
+                # Free the previous model before a different one is loaded next to it
+                self.unload_model()
+            model_future = self.start_model_load()
+        
+        # Decode the audio in memory, falling back to a temporary WAV file
+        audio = self.decode_audio(self.audio_path)
+        if audio is None:
+            audio = self.convert_audio_to_wav(self.audio_path)
+            if not audio:
+                return
+        
+        # Wait for the Whisper model unless it was loaded or preloaded already
+        if model_future is not None and not model_future.done():
+            status_text = "[bold green]Loading Whisper model..."
+        else:
+            status_text = "[bold green]Transcribing audio...[/bold green]"
+        with console.status(status_text) as status:
             try:
-                self.model = whisper.load_model("base")
-                status.update("[bold green]Transcribing audio...[/bold green]")
-                
-                # Transcribe audio
-                result = self.model.transcribe(wav_path, word_timestamps=True)
-                
-                # Process results and convert to ASCII art
-                output = []
-                for segment in result["segments"]:
-                    for word in segment.get("words", []):
-                        # Generate ASCII art for each word
-                        ascii_art = generate_ascii_art(word["word"].strip())
-                        ascii_text = "\n".join(ascii_art)
-                        
-                        output.append({
-                            "word": word["word"].strip(),
-                            "ascii_art": ascii_text,
-                            "start": word["start"],
-                            "end": word["end"]
-                        })
+                if model_future is not None:
+                    self.model = model_future.result()
+                    self._model_key = model_key
+                    status.update("[bold green]Transcribing audio...[/bold green]")
                 
-                # Save to JSON
-                with open(output_json_path, "w", encoding="utf-8") as f:
-                    json.dump(output, f, indent=2, ensure_ascii=False)
+                # Stream to JSON as words are transcribed
+                self.write_lyrics(output_json_path, self.transcribe_words(audio))
+                copy_lyrics(output_json_path, cache_path, pretty=False if self.pretty_json else None)
                 
-                self.lyrics = output
                 console.print(f"[bold green]Transcription complete![/bold green] Saved to {output_json_path}")
                 return output_json_path
             
@@ -628,6 +1227,29 @@ class LyricGenerator:
                 console.print(f"[bold red]Error during transcription:[/bold red] {str(e)}")
                 return None
     
+    def load_lyrics(self, json_path):
+        """Load (starts, ends, words) for a lyrics file, reusing the last parse if it is unchanged."""
+        key = str(json_path)
+        mtime = os.path.getmtime(json_path)
+        cached = self.lyrics_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # Prefer the NumPy sidecar over parsing the JSON
+        timings = load_timings(json_path)
+        if timings is None:
+            lyrics = load_json(json_path)
+            # Whisper emits words in order; keep hand-edited files chronological too
+            if any(a["start"] > b["start"] for a, b in zip(lyrics, lyrics[1:])):
+                lyrics.sort(key=lambda item: item["start"])
+            timings = (
+                array.array('d', (item["start"] for item in lyrics)),
+                array.array('d', (item["end"] for item in lyrics)),
+                [item["word"] for item in lyrics]
+            )
+        self.lyrics_cache[key] = (mtime, timings)
+        return timings
+    
     def play_audio_with_lyrics(self, audio_path=None) -> None:
         """Play audio file with synchronized lyrics display."""
         if audio_path:
@@ -649,12 +1271,25 @@ class LyricGenerator:
             else:
                 return
         
-        # Load lyrics
-        with open(json_path, encoding="utf-8") as f:
-            lyrics = json.load(f)
+        # Load lyrics as parallel arrays so showing a word only indexes
+        starts, ends, words = self.load_lyrics(json_path)
         
-        # Convert to WAV if needed
-        wav_path = self.convert_audio_to_wav(self.audio_path)
+        # PortAudio playback decodes the source once, in memory, when libsndfile can read it
+        pcm = None
+        if SOUNDDEVICE_AVAILABLE:
+            try:
+                pcm = sf.read(self.audio_path, dtype="float32", always_2d=True)
+            except Exception:
+                pcm = None
+        
+        # Convert to WAV only for a player that cannot read the original: ffplay
+        # and simulated playback take any format
+        if SOUNDDEVICE_AVAILABLE:
+            needs_wav = pcm is None
+        else:
+            extension = os.path.splitext(self.audio_path)[1].lower()
+            needs_wav = PLAYSOUND_AVAILABLE and stop_playsound is None and extension not in PLAYSOUND_EXTS
+        wav_path = self.convert_audio_to_wav(self.audio_path) if needs_wav else self.audio_path
         if not wav_path:
             return
         
@@ -679,122 +1314,215 @@ class LyricGenerator:
             border_style="green"
         ))
         
+        # Set once audio output starts so the lyrics clock begins with the music
+        playback_started = threading.Event()
+        playback_stopped = threading.Event()
+        playback_clock = {}
+        
         # Function to play music
         def play_music():
-            if PLAYSOUND_AVAILABLE:
-                try:
-                    playsound(wav_path)
-                except Exception as e:
-                    console.print(f"[bold red]Error playing audio:[/bold red] {str(e)}")
-            else:
-                # Simulate audio playback duration if playsound is not available
-                try:
-                    # Try to get audio duration using ffmpeg
+            try:
+                if SOUNDDEVICE_AVAILABLE:
+                    # Play in-process through PortAudio instead of spawning a player
                     try:
-                        if FFMPEG_AVAILABLE:
-                            probe = ffmpeg.probe(wav_path)
-                            duration = float(probe['format']['duration'])
-                        else:
-                            # Estimate duration based on lyrics end time
-                            if lyrics and len(lyrics) > 0:
-                                duration = max(item["end"] for item in lyrics) + 2.0
-                            else:
-                                duration = 30.0  # Default duration
+                        data, samplerate = pcm if pcm is not None else sf.read(wav_path, dtype="float32", always_2d=True)
+                        finished = threading.Event()
+                        position = 0
+                        
+                        def callback(outdata, frames, time_info, status):
+                            nonlocal position
+                            if playback_stopped.is_set():
+                                raise sd.CallbackAbort
+                            if position == 0 or status.output_underflow:
+                                # Start the lyrics clock when the first sample reaches the DAC,
+                                # and move it back by the gap whenever the output runs dry
+                                latency = 0.0
+                                if time_info.currentTime:
+                                    latency = time_info.outputBufferDacTime - time_info.currentTime
+                                playback_clock["start"] = (
+                                    time.monotonic() + min(max(latency, 0.0), 1.0) - position / samplerate
+                                )
+                                playback_started.set()
+                            
+                            chunk = data[position:position + frames]
+                            outdata[:len(chunk)] = chunk
+                            position += frames
+                            if len(chunk) < frames:
+                                outdata[len(chunk):] = 0
+                                raise sd.CallbackStop
                         
-                        console.print("[yellow]Audio playback not available. Simulating playback...[/yellow]")
-                        time.sleep(duration)
+                        with sd.OutputStream(
+                            samplerate=samplerate,
+                            channels=data.shape[1],
+                            dtype="float32",
+                            blocksize=256,
+                            latency="low",
+                            callback=callback,
+                            finished_callback=finished.set
+                        ):
+                            finished.wait()
                     except Exception as e:
-                        console.print(f"[bold red]Error simulating audio playback:[/bold red] {str(e)}")
-                        # Default sleep if we can't determine duration
-                        time.sleep(30)
-                except KeyboardInterrupt:
-                    console.print("[yellow]Playback stopped by user.[/yellow]")
-        
-        # Function to display lyrics with ASCII art
-        def display_lyrics():
-            start_time = time.time()
-            current_index = 0
-            current_word = ""
-            buffer_words = []
-            last_update_time = 0
+                        console.print(f"[bold red]Error playing audio:[/bold red] {str(e)}")
+                elif PLAYSOUND_AVAILABLE:
+                    try:
+                        playback_started.set()
+                        playsound(wav_path)
+                    except Exception as e:
+                        console.print(f"[bold red]Error playing audio:[/bold red] {str(e)}")
+                else:
+                    # Simulate audio playback duration if playsound is not available
+                    try:
+                        # Try to get audio duration using ffmpeg
+                        try:
+                            if FFMPEG_AVAILABLE:
+                                duration = probe_duration(wav_path, os.path.getmtime(wav_path))
+                            else:
+                                # Estimate duration based on lyrics end time
+                                if len(ends):
+                                    duration = ends[-1] + 2.0
+                                else:
+                                    duration = 30.0  # Default duration
+                            
+                            console.print("[yellow]Audio playback not available. Simulating playback...[/yellow]")
+                            playback_started.set()
+                            playback_stopped.wait(duration)
+                        except Exception as e:
+                            console.print(f"[bold red]Error simulating audio playback:[/bold red] {str(e)}")
+                            # Default sleep if we can't determine duration
+                            playback_started.set()
+                            playback_stopped.wait(30)
+                    except KeyboardInterrupt:
+                        console.print("[yellow]Playback stopped by user.[/yellow]")
+            finally:
+                # Never leave the lyrics thread waiting if playback failed to start
+                playback_started.set()
+        
+        # Render all ASCII art before playback, together with the styled spans of
+        # each word's text, so showing a word does no rendering
+        frames = []
+        for word in words:
+            ascii_art = generate_ascii_art(word) + "\n"
+            content = ascii_art + "\n" + word + "\n"
+            spans = []
+            if RICH_AVAILABLE:
+                spans = [Span(0, len(ascii_art), ART_STYLE), Span(len(ascii_art), len(content), WORD_STYLE)]
+            frames.append((content, spans))
+        
+        # Function to display a word with ASCII art
+        def show_word(index):
+            # Swap in the whole prerendered text: ASCII art above, plain word below
+            content, spans = frames[index]
+            lyrics_text.plain = content
+            lyrics_text.spans = spans
             
-            try:
-                while current_index < len(lyrics):
-                    now = time.time()
-                    elapsed = now - start_time
-                    
-                    # Display words that should be shown by now
-                    while current_index < len(lyrics) and lyrics[current_index]["start"] <= elapsed:
-                        word = lyrics[current_index]["word"]
-                        ascii_art = lyrics[current_index].get("ascii_art", "")
-                        
-                        # If ASCII art is not in the JSON, generate it now
-                        if not ascii_art:
-                            ascii_lines = generate_ascii_art(word)
-                            ascii_art = "\n".join(ascii_lines)
-                        
-                        # Clear previous content
-                        lyrics_text.plain = ""
-                        
-                        # Display the ASCII art
-                        lyrics_text.append(ascii_art + "\n", style="bold cyan")
-                        
-                        # Add the plain text version below
-                        lyrics_text.append("\n" + word + "\n", style="bold green")
-                        
-                        current_index += 1
-                        time.sleep(0.1)  # Small pause between words
-                    
-                    time.sleep(0.05)  # Small sleep to prevent CPU hogging
-            except KeyboardInterrupt:
-                console.print("[yellow]Lyrics display stopped by user.[/yellow]")
+            # Redraw only when a word changes
+            live.refresh()
+            
+            # The plain text interface writes each word out in a single flush
+            if not RICH_AVAILABLE:
+                lyrics_text.flush()
         
-        # Start threads
-        music_thread = threading.Thread(target=play_music)
-        lyrics_thread = threading.Thread(target=display_lyrics)
+        # Function to schedule every word on one event loop timer
+        async def display_lyrics():
+            loop = asyncio.get_running_loop()
+            music_done = asyncio.Event()
+            
+            def play_and_notify():
+                try:
+                    play_music()
+                finally:
+                    try:
+                        loop.call_soon_threadsafe(music_done.set)
+                    except RuntimeError:
+                        # The loop is already closed after Ctrl+C
+                        pass
+            
+            # Audio plays on its own thread (or PortAudio's callback thread)
+            music_thread = threading.Thread(target=play_and_notify, daemon=True)
+            music_thread.start()
+            await loop.run_in_executor(None, playback_started.wait)
+            
+            # loop.time() is time.monotonic(), the clock the audio start is latched on
+            start_time = playback_clock.get("start", loop.time())
+            
+            def show_latest(index):
+                nonlocal start_time
+                latched = playback_clock.get("start", start_time)
+                if latched != start_time:
+                    # The audio clock slipped after an underflow; move the remaining words with it
+                    start_time = latched
+                    for later in range(index, len(starts)):
+                        handles[later].cancel()
+                        handles[later] = loop.call_at(start_time + starts[later], show_latest, later)
+                    return
+                
+                # After a stall the loop runs overdue timers back to back, so only
+                # draw a word if the next one is not already due
+                if index + 1 < len(starts) and loop.time() >= start_time + starts[index + 1]:
+                    return
+                show_word(index)
+            
+            handles = [loop.call_at(start_time + start, show_latest, index) for index, start in enumerate(starts)]
+            try:
+                await music_done.wait()
+                # Words timed past the end of the audio still get shown
+                if len(starts):
+                    await asyncio.sleep(start_time + starts[-1] - loop.time())
+            finally:
+                for handle in handles:
+                    handle.cancel()
         
         console.print("[bold green]Starting playback with lyrics...[/bold green]")
         console.print("[italic](Press Ctrl+C to stop)[/italic]")
         
         # Display audio playback status
-        if not PLAYSOUND_AVAILABLE:
+        if not SOUNDDEVICE_AVAILABLE and not PLAYSOUND_AVAILABLE:
             console.print("[yellow]Audio playback is disabled. Running in lyrics-only mode.[/yellow]")
         
         try:
-            with Live(layout, refresh_per_second=10):
-                music_thread.start()
-                lyrics_thread.start()
-                music_thread.join()
-                lyrics_thread.join()
+            with Live(layout, auto_refresh=False) as live:
+                asyncio.run(display_lyrics())
         except KeyboardInterrupt:
+            # Stop the audio as well instead of letting it play on in the background
+            playback_stopped.set()
+            if stop_playsound:
+                stop_playsound()
             console.print("[yellow]Playback stopped by user.[/yellow]")
     
+    def transcribe_selected_audio(self) -> None:
+        """Transcribe the selected audio file, offering to select one first."""
+        if not self.audio_path:
+            console.print("[yellow]No audio file selected. Please select an audio file first.[/yellow]")
+            if Confirm.ask("Would you like to select an audio file now?"):
+                self.select_audio_file()
+                if self.audio_path:
+                    self.transcribe_audio()
+        else:
+            self.transcribe_audio()
+    
     def run(self) -> None:
         """Run the main application loop."""
         self.display_welcome()
         
+        # Load the model while the menu waits for input, so the first
+        # transcription does not have to
+        if self.preload_model and self.resolve_backend() is not None:
+            self.start_model_load()
+        
+        # Menu options mapped to their handlers
+        handlers = {
+            "1": self.transcribe_selected_audio,  # Convert audio to lyrics
+            "2": self.play_audio_with_lyrics,  # Play audio with lyrics
+            "3": self.select_audio_file,  # Select audio file
+            "4": self.display_audio_files,  # View available audio files
+        }
+        
         while True:
             choice = self.show_main_menu()
             
-            if choice == "1":  # Convert audio to lyrics
-                if not self.audio_path:
-                    console.print("[yellow]No audio file selected. Please select an audio file first.[/yellow]")
-                    if Confirm.ask("Would you like to select an audio file now?"):
-                        self.select_audio_file()
-                        if self.audio_path:
-                            self.transcribe_audio()
-                else:
-                    self.transcribe_audio()
-            
-            elif choice == "2":  # Play audio with lyrics
-                self.play_audio_with_lyrics()
-            
-            elif choice == "3":  # Select audio file
-                self.select_audio_file()
-            
-            elif choice == "4":  # View available audio files
-                self.display_audio_files()
-            
+            handler = handlers.get(choice)
+            if handler:
+                handler()
             elif choice == "5":  # Exit
                 console.print("[bold blue]Thank you for using Automatic Lyrics Generator![/bold blue]")
                 break
@@ -811,7 +1539,27 @@ def parse_arguments():
     parser.add_argument("-p", "--play", action="store_true", help="Play audio with lyrics")
     parser.add_argument("-l", "--list", action="store_true", help="List available audio files")
     parser.add_argument("-d", "--directory", help="Base directory for the application")
-    parser.add_argument("--no-audio", action="store_true", help="Run in lyrics-only mode without audio playback")
+    parser.add_argument(
+        "--batch-size", type=int, default=16,
+        help="Number of 30s windows transcribed at once (1 disables batching)"
+    )
+    parser.add_argument(
+        "--backend", choices=("auto",) + BACKENDS, default="auto",
+        help="Transcription backend; transformers runs distil-whisper (default: auto)"
+    )
+    parser.add_argument(
+        "--model",
+        help="Whisper model to transcribe with (default: base, or distil-large-v3 for transformers)"
+    )
+    parser.add_argument(
+        "--no-preload", dest="preload", action="store_false",
+        help="Do not load the Whisper model in the background while the menu is open"
+    )
+    parser.add_argument("--pretty", action="store_true", help="Write indented, human-readable lyrics JSON")
+    parser.add_argument(
+        "--no-audio", dest="audio", action="store_false",
+        help="Run in lyrics-only mode without audio playback"
+    )
     return parser.parse_args()
 
 
@@ -820,13 +1568,19 @@ def main():
     args = parse_arguments()
     
     # Check if no-audio flag is set
-    global PLAYSOUND_AVAILABLE
-    if args.no_audio:
+    global PLAYSOUND_AVAILABLE, SOUNDDEVICE_AVAILABLE
+    if not args.audio:
         PLAYSOUND_AVAILABLE = False
+        SOUNDDEVICE_AVAILABLE = False
         print("[yellow]Running in lyrics-only mode (--no-audio flag set)[/yellow]")
     
     # Initialize the application
     app = LyricGenerator(args.directory)
+    app.batch_size = args.batch_size
+    app.backend = args.backend
+    app.model_name = args.model
+    app.preload_model = args.preload
+    app.pretty_json = args.pretty
     
     # Process command line arguments
     if args.list: